@@ -12,12 +12,17 @@ sys.path.insert(0, str(project_root))
 
 if __name__ == "__main__":
     import uvicorn
-    
+    from src.config.settings import settings
+
+    # Auto-reload in development, one worker per CPU otherwise
+    is_development = settings.ENVIRONMENT == "development"
+
     # Run the FastAPI application
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=is_development,
+        workers=1 if is_development else settings.WEB_CONCURRENCY,
         log_level="info"
     )
\ No newline at end of file
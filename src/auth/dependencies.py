@@ -6,18 +6,21 @@ from src.models.user import User
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
+# For MVP, a single dummy user built once without validation
+_DUMMY_USER = User.model_construct(
+    username="admin",
+    password="hashed_password",
+    email="admin@example.com",
+    first_name="Admin",
+    last_name="User",
+    is_active=True
+)
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     """Get current user from token"""
-    # For MVP, return a dummy user
     # In production, this would decode JWT token and get user from database
-    return User(
-        username="admin",
-        password="hashed_password",
-        email="admin@example.com",
-        first_name="Admin",
-        last_name="User",
-        is_active=True
-    )
+    return _DUMMY_USER
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)):
@@ -1,5 +1,7 @@
+import sys
 from enum import Enum
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, FrozenSet
 
 
 class PermissionModule(str, Enum):
@@ -40,6 +42,11 @@ class SystemRole(str, Enum):
     AUDITOR = "auditor"
 
 
+def _perm(module: PermissionModule, action: PermissionAction) -> str:
+    """Build an interned "module.action" permission key"""
+    return sys.intern(f"{module.value}.{action.value}")
+
+
 # Permission definition by role
 PERMISSIONS_BY_ROLE: Dict[str, List[str]] = {
     SystemRole.SUPER_ADMIN: [
@@ -47,165 +54,175 @@ PERMISSIONS_BY_ROLE: Dict[str, List[str]] = {
     ],
     
     SystemRole.ADMIN: [
-        f"{PermissionModule.USERS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.USERS}.{PermissionAction.READ}",
-        f"{PermissionModule.USERS}.{PermissionAction.UPDATE}",
-        f"{PermissionModule.USERS}.{PermissionAction.DELETE}",
+        _perm(PermissionModule.USERS, PermissionAction.CREATE),
+        _perm(PermissionModule.USERS, PermissionAction.READ),
+        _perm(PermissionModule.USERS, PermissionAction.UPDATE),
+        _perm(PermissionModule.USERS, PermissionAction.DELETE),
         
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.READ}",
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.UPDATE}",
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.DELETE}",
+        _perm(PermissionModule.PRODUCTS, PermissionAction.CREATE),
+        _perm(PermissionModule.PRODUCTS, PermissionAction.READ),
+        _perm(PermissionModule.PRODUCTS, PermissionAction.UPDATE),
+        _perm(PermissionModule.PRODUCTS, PermissionAction.DELETE),
         
-        f"{PermissionModule.WAREHOUSES}.{PermissionAction.CREATE}",
-        f"{PermissionModule.WAREHOUSES}.{PermissionAction.READ}",
-        f"{PermissionModule.WAREHOUSES}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.WAREHOUSES, PermissionAction.CREATE),
+        _perm(PermissionModule.WAREHOUSES, PermissionAction.READ),
+        _perm(PermissionModule.WAREHOUSES, PermissionAction.UPDATE),
         
-        f"{PermissionModule.INVENTORY}.{PermissionAction.READ}",
-        f"{PermissionModule.INVENTORY}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.INVENTORY, PermissionAction.READ),
+        _perm(PermissionModule.INVENTORY, PermissionAction.UPDATE),
         
-        f"{PermissionModule.SALES}.{PermissionAction.READ}",
-        f"{PermissionModule.SALES}.{PermissionAction.EXPORT}",
+        _perm(PermissionModule.SALES, PermissionAction.READ),
+        _perm(PermissionModule.SALES, PermissionAction.EXPORT),
         
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.READ}",
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.CREATE),
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.READ),
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.UPDATE),
         
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.READ}",
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.APPROVE}",
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.REJECT}",
+        _perm(PermissionModule.TRANSFERS, PermissionAction.READ),
+        _perm(PermissionModule.TRANSFERS, PermissionAction.APPROVE),
+        _perm(PermissionModule.TRANSFERS, PermissionAction.REJECT),
         
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.READ}",
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.INCIDENTS, PermissionAction.READ),
+        _perm(PermissionModule.INCIDENTS, PermissionAction.UPDATE),
         
-        f"{PermissionModule.FINANCES}.{PermissionAction.READ}",
-        f"{PermissionModule.FINANCES}.{PermissionAction.APPROVE}",
+        _perm(PermissionModule.FINANCES, PermissionAction.READ),
+        _perm(PermissionModule.FINANCES, PermissionAction.APPROVE),
         
-        f"{PermissionModule.REPORTS}.{PermissionAction.READ}",
-        f"{PermissionModule.REPORTS}.{PermissionAction.EXPORT}",
+        _perm(PermissionModule.REPORTS, PermissionAction.READ),
+        _perm(PermissionModule.REPORTS, PermissionAction.EXPORT),
         
-        f"{PermissionModule.AUDIT}.{PermissionAction.READ}",
+        _perm(PermissionModule.AUDIT, PermissionAction.READ),
         
-        f"{PermissionModule.CONFIGURATION}.{PermissionAction.READ}",
-        f"{PermissionModule.CONFIGURATION}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.CONFIGURATION, PermissionAction.READ),
+        _perm(PermissionModule.CONFIGURATION, PermissionAction.UPDATE),
     ],
     
     SystemRole.MANAGER: [
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.READ}",
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.PRODUCTS, PermissionAction.READ),
+        _perm(PermissionModule.PRODUCTS, PermissionAction.UPDATE),
         
-        f"{PermissionModule.WAREHOUSES}.{PermissionAction.READ}",
+        _perm(PermissionModule.WAREHOUSES, PermissionAction.READ),
         
-        f"{PermissionModule.INVENTORY}.{PermissionAction.READ}",
-        f"{PermissionModule.INVENTORY}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.INVENTORY, PermissionAction.READ),
+        _perm(PermissionModule.INVENTORY, PermissionAction.UPDATE),
         
-        f"{PermissionModule.SALES}.{PermissionAction.READ}",
-        f"{PermissionModule.SALES}.{PermissionAction.EXPORT}",
+        _perm(PermissionModule.SALES, PermissionAction.READ),
+        _perm(PermissionModule.SALES, PermissionAction.EXPORT),
         
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.READ}",
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.CREATE),
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.READ),
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.UPDATE),
         
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.READ}",
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.APPROVE}",
+        _perm(PermissionModule.TRANSFERS, PermissionAction.CREATE),
+        _perm(PermissionModule.TRANSFERS, PermissionAction.READ),
+        _perm(PermissionModule.TRANSFERS, PermissionAction.APPROVE),
         
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.READ}",
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.INCIDENTS, PermissionAction.CREATE),
+        _perm(PermissionModule.INCIDENTS, PermissionAction.READ),
+        _perm(PermissionModule.INCIDENTS, PermissionAction.UPDATE),
         
-        f"{PermissionModule.FINANCES}.{PermissionAction.CREATE}",
-        f"{PermissionModule.FINANCES}.{PermissionAction.READ}",
+        _perm(PermissionModule.FINANCES, PermissionAction.CREATE),
+        _perm(PermissionModule.FINANCES, PermissionAction.READ),
         
-        f"{PermissionModule.REPORTS}.{PermissionAction.READ}",
-        f"{PermissionModule.REPORTS}.{PermissionAction.EXPORT}",
+        _perm(PermissionModule.REPORTS, PermissionAction.READ),
+        _perm(PermissionModule.REPORTS, PermissionAction.EXPORT),
     ],
     
     SystemRole.SALESPERSON: [
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.READ}",
+        _perm(PermissionModule.PRODUCTS, PermissionAction.READ),
         
-        f"{PermissionModule.INVENTORY}.{PermissionAction.READ}",
+        _perm(PermissionModule.INVENTORY, PermissionAction.READ),
         
-        f"{PermissionModule.SALES}.{PermissionAction.CREATE}",
-        f"{PermissionModule.SALES}.{PermissionAction.READ}",
+        _perm(PermissionModule.SALES, PermissionAction.CREATE),
+        _perm(PermissionModule.SALES, PermissionAction.READ),
         
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.READ}",
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.CREATE),
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.READ),
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.UPDATE),
         
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.READ}",
+        _perm(PermissionModule.INCIDENTS, PermissionAction.CREATE),
+        _perm(PermissionModule.INCIDENTS, PermissionAction.READ),
     ],
     
     SystemRole.WAREHOUSE_KEEPER: [
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.READ}",
+        _perm(PermissionModule.PRODUCTS, PermissionAction.READ),
         
-        f"{PermissionModule.INVENTORY}.{PermissionAction.READ}",
-        f"{PermissionModule.INVENTORY}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.INVENTORY, PermissionAction.READ),
+        _perm(PermissionModule.INVENTORY, PermissionAction.UPDATE),
         
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.READ}",
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.UPDATE}",
+        _perm(PermissionModule.TRANSFERS, PermissionAction.CREATE),
+        _perm(PermissionModule.TRANSFERS, PermissionAction.READ),
+        _perm(PermissionModule.TRANSFERS, PermissionAction.UPDATE),
         
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.READ}",
+        _perm(PermissionModule.INCIDENTS, PermissionAction.CREATE),
+        _perm(PermissionModule.INCIDENTS, PermissionAction.READ),
     ],
     
     SystemRole.CASHIER: [
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.READ}",
+        _perm(PermissionModule.PRODUCTS, PermissionAction.READ),
         
-        f"{PermissionModule.SALES}.{PermissionAction.CREATE}",
-        f"{PermissionModule.SALES}.{PermissionAction.READ}",
+        _perm(PermissionModule.SALES, PermissionAction.CREATE),
+        _perm(PermissionModule.SALES, PermissionAction.READ),
         
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.CREATE}",
-        f"{PermissionModule.CUSTOMERS}.{PermissionAction.READ}",
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.CREATE),
+        _perm(PermissionModule.CUSTOMERS, PermissionAction.READ),
         
-        f"{PermissionModule.FINANCES}.{PermissionAction.CREATE}",
-        f"{PermissionModule.FINANCES}.{PermissionAction.READ}",
+        _perm(PermissionModule.FINANCES, PermissionAction.CREATE),
+        _perm(PermissionModule.FINANCES, PermissionAction.READ),
     ],
     
     SystemRole.AUDITOR: [
-        f"{PermissionModule.USERS}.{PermissionAction.READ}",
-        f"{PermissionModule.PRODUCTS}.{PermissionAction.READ}",
-        f"{PermissionModule.INVENTORY}.{PermissionAction.READ}",
-        f"{PermissionModule.SALES}.{PermissionAction.READ}",
-        f"{PermissionModule.SALES}.{PermissionAction.EXPORT}",
-        f"{PermissionModule.TRANSFERS}.{PermissionAction.READ}",
-        f"{PermissionModule.INCIDENTS}.{PermissionAction.READ}",
-        f"{PermissionModule.FINANCES}.{PermissionAction.READ}",
-        f"{PermissionModule.FINANCES}.{PermissionAction.EXPORT}",
-        f"{PermissionModule.REPORTS}.{PermissionAction.READ}",
-        f"{PermissionModule.REPORTS}.{PermissionAction.EXPORT}",
-        f"{PermissionModule.AUDIT}.{PermissionAction.READ}",
-        f"{PermissionModule.AUDIT}.{PermissionAction.EXPORT}",
+        _perm(PermissionModule.USERS, PermissionAction.READ),
+        _perm(PermissionModule.PRODUCTS, PermissionAction.READ),
+        _perm(PermissionModule.INVENTORY, PermissionAction.READ),
+        _perm(PermissionModule.SALES, PermissionAction.READ),
+        _perm(PermissionModule.SALES, PermissionAction.EXPORT),
+        _perm(PermissionModule.TRANSFERS, PermissionAction.READ),
+        _perm(PermissionModule.INCIDENTS, PermissionAction.READ),
+        _perm(PermissionModule.FINANCES, PermissionAction.READ),
+        _perm(PermissionModule.FINANCES, PermissionAction.EXPORT),
+        _perm(PermissionModule.REPORTS, PermissionAction.READ),
+        _perm(PermissionModule.REPORTS, PermissionAction.EXPORT),
+        _perm(PermissionModule.AUDIT, PermissionAction.READ),
+        _perm(PermissionModule.AUDIT, PermissionAction.EXPORT),
     ],
 }
 
 
-def has_permission(user_roles: List[str], required_permission: str) -> bool:
-    """Check if user has a specific permission"""
-    
+# Role permissions as frozensets for O(1) membership checks
+_PERMS_SET: Dict[str, FrozenSet[str]] = {
+    role: frozenset(permissions) for role, permissions in PERMISSIONS_BY_ROLE.items()
+}
+
+# Roles with total access
+_WILDCARD_ROLES: FrozenSet[str] = frozenset(
+    role for role, permissions in _PERMS_SET.items() if "*" in permissions
+)
+
+
+@lru_cache(maxsize=1024)
+def _has_permission_cached(user_roles: FrozenSet[str], required_permission: str) -> bool:
     # Check if any role has total access
-    for role in user_roles:
-        role_permissions = PERMISSIONS_BY_ROLE.get(role, [])
-        if "*" in role_permissions:
-            return True
+    if _WILDCARD_ROLES.intersection(user_roles):
+        return True
     
     # Check specific permission
-    for role in user_roles:
-        role_permissions = PERMISSIONS_BY_ROLE.get(role, [])
-        if required_permission in role_permissions:
-            return True
-    
-    return False
+    return any(
+        required_permission in _PERMS_SET.get(role, ())
+        for role in user_roles
+    )
+
+
+@lru_cache(maxsize=256)
+def _user_permissions_cached(user_roles: FrozenSet[str]) -> FrozenSet[str]:
+    return frozenset().union(*(_PERMS_SET.get(role, ()) for role in user_roles))
+
+
+def has_permission(user_roles: List[str], required_permission: str) -> bool:
+    """Check if user has a specific permission"""
+    return _has_permission_cached(frozenset(user_roles), required_permission)
 
 
 def get_user_permissions(user_roles: List[str]) -> List[str]:
     """Get all user permissions based on their roles"""
-    permissions = set()
-    
-    for role in user_roles:
-        role_permissions = PERMISSIONS_BY_ROLE.get(role, [])
-        permissions.update(role_permissions)
-    
-    return list(permissions)
\ No newline at end of file
+    return list(_user_permissions_cached(frozenset(user_roles)))
\ No newline at end of file
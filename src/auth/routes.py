@@ -1,22 +1,43 @@
+import asyncio
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, status, Form
+from fastapi import APIRouter, status, Form
+from fastapi.responses import ORJSONResponse
+from starlette.background import BackgroundTask
+from pymongo import ReturnDocument
 
-from src.models.user import User
+from src.models.user import User, UserLoginProjection, USER_LOGIN_PROJECTION
 from src.models.audit import AccessLog
 from src.auth.security import verify_password
 
 router = APIRouter(tags=["Authentication"])
 
 
+def _unauthorized(detail: str, access_log: AccessLog) -> ORJSONResponse:
+    """Respuesta 401 que guarda el log de acceso después de enviarla"""
+    return ORJSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={"detail": detail},
+        background=BackgroundTask(access_log.insert)
+    )
+
+
 @router.post("/login")
 async def login(username: str = Form(...), password: str = Form(...)):
     """Iniciar sesión simple con username y password"""
 
-    # Buscar usuario
-    user = await User.find_one({"username": username})
+    # Buscar usuario e incrementar de forma tentativa los intentos fallidos;
+    # el contador se reinicia si la contraseña es correcta
+    user_data = await User.get_motor_collection().find_one_and_update(
+        {"username": username},
+        {"$inc": {"failed_login_attempts": 1}},
+        projection=USER_LOGIN_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
+    user = UserLoginProjection.model_validate(user_data) if user_data else None
 
-    # Log de intento de acceso
-    access_log = AccessLog(
+    # Log de intento de acceso (sin validación: todos los valores son
+    # controlados por este endpoint)
+    access_log = AccessLog.model_construct(
         attemptedUsername=username,
         ipAddress="127.0.0.1",
         accessType="login",
@@ -25,53 +46,39 @@ async def login(username: str = Form(...), password: str = Form(...)):
 
     if not user:
         access_log.failureReason = "Usuario no encontrado"
-        await access_log.insert()
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Credenciales incorrectas"
-        )
+        return _unauthorized("Credenciales incorrectas", access_log)
 
     if not user.is_active:
         access_log.userId = str(user.id)
         access_log.failureReason = "Usuario inactivo"
-        await access_log.insert()
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Usuario inactivo"
-        )
+        return _unauthorized("Usuario inactivo", access_log)
 
     if not verify_password(password, user.password):
         access_log.userId = str(user.id)
         access_log.failureReason = "Contraseña incorrecta"
-        await access_log.insert()
-
-        # Incrementar intentos fallidos
-        user.failed_login_attempts += 1
-        await user.save()
 
         # Bloquear usuario después de 5 intentos
         if user.failed_login_attempts >= 5:
-            user.is_active = False
-            await user.save()
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Usuario bloqueado por múltiples intentos fallidos"
+            await User.find_one({"_id": user.id}).set({"is_active": False})
+            return _unauthorized(
+                "Usuario bloqueado por múltiples intentos fallidos",
+                access_log
             )
 
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Credenciales incorrectas"
-        )
-
-    # Login exitoso
-    user.last_login = datetime.utcnow()
-    user.failed_login_attempts = 0
-    await user.save()
+        return _unauthorized("Credenciales incorrectas", access_log)
 
     # Log exitoso
     access_log.userId = str(user.id)
     access_log.successful = True
-    await access_log.insert()
+
+    # Login exitoso: guardar usuario y log en paralelo
+    await asyncio.gather(
+        User.find_one({"_id": user.id}).set({
+            "last_login": datetime.utcnow(),
+            "failed_login_attempts": 0
+        }),
+        access_log.insert()
+    )
 
     return {
         "message": "Login exitoso",
@@ -90,4 +97,4 @@ async def get_current_user_info():
 @router.post("/logout")
 async def logout():
     """Cerrar sesión - simplificado"""
-    return {"message": "Sesión cerrada exitosamente"}
\ No newline at end of file
+    return {"message": "Sesión cerrada exitosamente"}
@@ -15,7 +15,14 @@ async def connect_to_mongo():
     """Create MongoDB connection"""
     global client
     try:
-        client = AsyncIOMotorClient(settings.MONGODB_URL)
+        client = AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            uuidRepresentation="standard"
+        )
         # Verify connection
         await client.admin.command('ping')
         logger.info(f"Connected to MongoDB: {settings.MONGODB_URL}")
@@ -11,6 +11,10 @@ class Settings:
         # Database
         self.MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
         self.DATABASE_NAME = os.getenv("DATABASE_NAME", "sistema_gestion")
+        self.MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "10"))
+        self.MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+        self.MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000"))
+        self.MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000"))
 
         # Security (simplified for MVP)
         self.SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
@@ -23,6 +27,9 @@ class Settings:
         # Environment
         self.ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
+        # Server
+        self.WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+
         # CORS
         self.ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*").split(",")
 
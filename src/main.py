@@ -1,6 +1,8 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from pymongo.errors import PyMongoError
+import orjson
 import time
 import logging
 import sys
@@ -51,6 +53,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -65,9 +68,8 @@ app.add_middleware(
 
 
 # Middleware de logging de requests
-@app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Log request
     logger.info(f"Request: {request.method} {request.url}")
@@ -76,7 +78,7 @@ async def log_requests(request: Request, call_next):
     response = await call_next(request)
     
     # Log response
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     logger.info(
         f"Response: {response.status_code} - "
         f"Time: {process_time:.4f}s - "
@@ -86,11 +88,16 @@ async def log_requests(request: Request, call_next):
     return response
 
 
-# Manejador global de excepciones
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Error no manejado: {exc}", exc_info=True)
-    return JSONResponse(
+# En producción el access log de uvicorn ya registra cada request
+if settings.ENVIRONMENT == "development":
+    app.middleware("http")(log_requests)
+
+
+# Manejador de errores de base de datos
+@app.exception_handler(PyMongoError)
+async def database_exception_handler(request: Request, exc: PyMongoError):
+    logger.error(f"Error de base de datos: {exc}", exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "error_interno",
@@ -100,28 +107,36 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+# Cuerpos precalculados de los endpoints estáticos; /health solo
+# serializa el timestamp en cada request
+_HEALTH_PREFIX = b'{"status":"ok","timestamp":'
+_HEALTH_SUFFIX = b"," + orjson.dumps({
+    "version": "1.0.0",
+    "environment": settings.ENVIRONMENT
+})[1:]
+_ROOT_BODY = orjson.dumps({
+    "mensaje": "Sistema de Gestión API",
+    "version": "1.0.0",
+    "docs": "/api/docs",
+    "redoc": "/api/redoc"
+})
+
+
 # Endpoint de salud
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Endpoint para verificar el estado de la aplicación"""
-    return {
-        "status": "ok",
-        "timestamp": time.time(),
-        "version": "1.0.0",
-        "environment": settings.ENVIRONMENT
-    }
+    return Response(
+        _HEALTH_PREFIX + orjson.dumps(time.time()) + _HEALTH_SUFFIX,
+        media_type="application/json"
+    )
 
 
 # Endpoint raíz
 @app.get("/", tags=["Root"])
 async def root():
     """Endpoint raíz de la API"""
-    return {
-        "mensaje": "Sistema de Gestión API",
-        "version": "1.0.0",
-        "docs": "/api/docs",
-        "redoc": "/api/redoc"
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 # Importar y registrar routers
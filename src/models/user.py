@@ -1,6 +1,7 @@
-from beanie import Document, Indexed
+from beanie import Document, Indexed, PydanticObjectId
 from datetime import datetime
 from typing import Optional, List
+from pydantic import BaseModel, Field
 from pymongo import IndexModel
 
 
@@ -11,7 +12,7 @@ class User(Document):
     first_name: str
     last_name: str
     is_active: bool = True
-    created_at: datetime = datetime.utcnow()
+    created_at: datetime = Field(default_factory=datetime.utcnow)
     last_login: Optional[datetime] = None
     failed_login_attempts: int = 0
     roles: List[str] = []  # Role IDs
@@ -26,11 +27,26 @@ class User(Document):
         ]
 
 
+class UserLoginProjection(BaseModel):
+    """Fields needed to authenticate a user"""
+    id: PydanticObjectId = Field(alias="_id")
+    username: str
+    password: str
+    is_active: bool = True
+    failed_login_attempts: int = 0
+
+
+# Mongo projection for UserLoginProjection, keyed by the stored field names
+USER_LOGIN_PROJECTION = {
+    field.alias or name: 1 for name, field in UserLoginProjection.model_fields.items()
+}
+
+
 class Token(Document):
     user_id: str
     token: Indexed(str, unique=True)
     type: str  # access/refresh
-    created_at: datetime = datetime.utcnow()
+    created_at: datetime = Field(default_factory=datetime.utcnow)
     expires_at: datetime
     is_active: bool = True
 
@@ -59,7 +75,7 @@ class Role(Document):
     description: Optional[str] = None
     permissions: List[str] = []  # Permission IDs
     is_active: bool = True
-    created_at: datetime = datetime.utcnow()
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Settings:
         collection = "roles"
@@ -1,7 +1,7 @@
-from beanie import Document, Indexed
+from beanie import Document, Indexed, PydanticObjectId
 from datetime import datetime
 from typing import Optional
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pymongo import IndexModel
 
 
@@ -23,6 +23,15 @@ class Warehouse(Document):
         indexes = [
             IndexModel([("code", 1)], unique=True),
             IndexModel([("name", 1)]),
-            IndexModel([("type", 1)]),
+            IndexModel([("type", 1), ("is_active", 1)]),
             IndexModel([("is_active", 1)]),
-        ]
\ No newline at end of file
+        ]
+
+
+class WarehouseListProjection(BaseModel):
+    """Fields needed to render a warehouse in list responses"""
+    id: PydanticObjectId = Field(alias="_id")
+    code: str
+    name: str
+    type: str
+    is_active: bool
\ No newline at end of file
@@ -12,7 +12,7 @@ __all__ = [
     "PaginatedResponse", "PaginationParams", "SearchParams", "DateRangeFilter",
     "SuccessResponse", "ErrorResponse", "FileUploadResponse",
     "GeneralStatistics", "InventoryReport", "SalesReport",
-    "StockValidation", "Notification",
+    "StockValidation", "Notification", "NotificationType",
     # Warehouse schemas
     "WarehouseBase", "WarehouseCreate", "WarehouseUpdate", "WarehouseResponse", "WarehouseListResponse"
 ]
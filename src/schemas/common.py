@@ -1,29 +1,62 @@
-from typing import Optional, List, Any
+import sys
+from typing import Annotated, Optional, List, Any, Generic, TypeVar
 from datetime import datetime
 from dataclasses import dataclass
+from enum import Enum
+
+from annotated_types import Ge
+
+
+# dataclass(slots=True) is only available from Python 3.10
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+T = TypeVar("T")
 
 
 # Generic schema for paginated responses
-@dataclass
-class PaginatedResponse:
-    items: List[Any]
+@dataclass(eq=False, **SLOTS)
+class PaginatedResponse(Generic[T]):
+    items: List[T]
     total: int
-    page: int
+    page: int  # echoes the requested page; ignored when paging by cursor
     pages: int
     size: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None  # pass back as cursor to get the next page
+
+    @classmethod
+    def build(
+        cls,
+        items: List[T],
+        total: int,
+        page: int,
+        size: int,
+        next_cursor: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> "PaginatedResponse[T]":
+        """Build a page computing pages and the navigation flags once"""
+        pages = -(-total // size)
+        # With a cursor the page number is meaningless, so navigation
+        # follows the cursors instead
+        if cursor is not None:
+            return cls(items, total, page, pages, size, next_cursor is not None, True, next_cursor)
+        return cls(items, total, page, pages, size, page < pages, page > 1, next_cursor)
 
 
 # Schema for pagination parameters
-@dataclass
+# A cursor (keyset pagination) takes precedence over page, so deep pages
+# do not pay for skipping every previous document; page is then ignored
+@dataclass(**SLOTS)
 class PaginationParams:
-    page: int = 1
-    size: int = 20
+    page: Annotated[int, Ge(1)] = 1
+    size: Annotated[int, Ge(1)] = 20
+    cursor: Optional[str] = None
 
 
 # Schema for search parameters
-@dataclass
+@dataclass(**SLOTS)
 class SearchParams:
     search: Optional[str] = None
     sort_by: Optional[str] = None
@@ -31,14 +64,14 @@ class SearchParams:
 
 
 # Schema for date filters
-@dataclass
+@dataclass(**SLOTS)
 class DateRangeFilter:
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
 
 # Schema for success response
-@dataclass
+@dataclass(**SLOTS)
 class SuccessResponse:
     success: bool
     message: str
@@ -46,7 +79,7 @@ class SuccessResponse:
 
 
 # Schema for error response
-@dataclass
+@dataclass(**SLOTS)
 class ErrorResponse:
     success: bool
     error: str
@@ -55,7 +88,7 @@ class ErrorResponse:
 
 
 # Schema for file upload
-@dataclass
+@dataclass(frozen=True, eq=False, **SLOTS)
 class FileUploadResponse:
     filename: str
     path: str
@@ -65,7 +98,7 @@ class FileUploadResponse:
 
 
 # Schema for general statistics
-@dataclass
+@dataclass(frozen=True, eq=False, **SLOTS)
 class GeneralStatistics:
     total_products: int
     total_warehouses: int
@@ -76,7 +109,7 @@ class GeneralStatistics:
 
 
 # Schema for inventory reports
-@dataclass
+@dataclass(frozen=True, eq=False, **SLOTS)
 class InventoryReport:
     warehouse_id: str
     warehouse_name: str
@@ -87,7 +120,7 @@ class InventoryReport:
 
 
 # Schema for sales reports
-@dataclass
+@dataclass(frozen=True, eq=False, **SLOTS)
 class SalesReport:
     date: datetime
     total_sales: int
@@ -97,7 +130,7 @@ class SalesReport:
 
 
 # Schema for stock validation
-@dataclass
+@dataclass(frozen=True, eq=False, **SLOTS)
 class StockValidation:
     product_id: str
     warehouse_id: str
@@ -106,10 +139,18 @@ class StockValidation:
     sufficient: bool
 
 
+class NotificationType(str, Enum):
+    """Notification severities"""
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+    SUCCESS = "success"
+
+
 # Schema for notifications
-@dataclass
+@dataclass(eq=False, **SLOTS)
 class Notification:
-    type: str  # info/warning/error/success
+    type: NotificationType
     title: str
     message: str
     date: datetime
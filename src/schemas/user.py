@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 from typing import Optional, List
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from src.schemas.common import SLOTS
 
 
 # Schemas base
-@dataclass
+@dataclass(**SLOTS)
 class UserBase:
     username: str
     email: str
@@ -12,22 +16,16 @@ class UserBase:
     last_name: str
     password: str
     is_active: bool = True
-    roles: List[str] = None
-    allowed_warehouses: List[str] = None
+    roles: List[str] = field(default_factory=list)
+    allowed_warehouses: List[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        if self.roles is None:
-            self.roles = []
-        if self.allowed_warehouses is None:
-            self.allowed_warehouses = []
 
-
-@dataclass
+@dataclass(**SLOTS)
 class UserCreate(UserBase):
     pass
 
 
-@dataclass
+@dataclass(**SLOTS)
 class UserUpdate:
     email: Optional[str] = None
     first_name: Optional[str] = None
@@ -37,29 +35,22 @@ class UserUpdate:
     allowed_warehouses: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(frozen=True, eq=False, **SLOTS)
 class UserResponse:
     id: str
     username: str
     email: str
     first_name: str
     last_name: str
-    password: str
     created_at: datetime
     is_active: bool = True
     last_login: Optional[datetime] = None
     failed_login_attempts: int = 0
-    roles: List[str] = None
-    allowed_warehouses: List[str] = None
+    roles: List[str] = field(default_factory=list)
+    allowed_warehouses: List[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        if self.roles is None:
-            self.roles = []
-        if self.allowed_warehouses is None:
-            self.allowed_warehouses = []
 
-
-@dataclass
+@dataclass(**SLOTS)
 class UserLogin:
     username: str
     password: str
@@ -69,24 +60,20 @@ class UserLogin:
 
 
 # Schemas para Rol
-@dataclass
+@dataclass(**SLOTS)
 class RoleBase:
     name: str
     description: Optional[str] = None
-    permissions: List[str] = None
+    permissions: List[str] = field(default_factory=list)
     is_active: bool = True
 
-    def __post_init__(self):
-        if self.permissions is None:
-            self.permissions = []
-
 
-@dataclass
+@dataclass(**SLOTS)
 class RoleCreate(RoleBase):
     pass
 
 
-@dataclass
+@dataclass(**SLOTS)
 class RoleUpdate:
     name: Optional[str] = None
     description: Optional[str] = None
@@ -94,14 +81,18 @@ class RoleUpdate:
     is_active: Optional[bool] = None
 
 
-@dataclass
-class RoleResponse(RoleBase):
+@dataclass(frozen=True, eq=False, **SLOTS)
+class RoleResponse:
     id: str
+    name: str
     created_at: datetime
+    description: Optional[str] = None
+    permissions: List[str] = field(default_factory=list)
+    is_active: bool = True
 
 
 # Schemas para Permiso
-@dataclass
+@dataclass(**SLOTS)
 class PermissionBase:
     code: str
     module: str
@@ -109,11 +100,15 @@ class PermissionBase:
     is_active: bool = True
 
 
-@dataclass
+@dataclass(**SLOTS)
 class PermissionCreate(PermissionBase):
     pass
 
 
-@dataclass
-class PermissionResponse(PermissionBase):
+@dataclass(frozen=True, eq=False, **SLOTS)
+class PermissionResponse:
     id: str
+    code: str
+    module: str
+    description: str
+    is_active: bool = True
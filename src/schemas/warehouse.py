@@ -1,46 +1,101 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from __future__ import annotations
+
+from typing import Annotated, Any, Dict, Literal, Optional
 from datetime import datetime
+from dataclasses import dataclass, field, fields
+
+from annotated_types import Gt, Len
+
+from src.schemas.common import SLOTS
+
+
+# Field constraints, enforced per field by Pydantic and published in the
+# OpenAPI schema
+WarehouseCode = Annotated[str, Len(1, 20)]
+WarehouseName = Annotated[str, Len(2, 100)]
+WarehouseType = Literal["warehouse", "store"]
+Capacity = Annotated[int, Gt(0)]
+
+
+class _Unset:
+    """Marks a field left out of a partial update"""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<unset>"
+
+    def __copy__(self) -> _Unset:
+        return self
+
+    def __deepcopy__(self, memo) -> _Unset:
+        return self
+
+
+_UNSET: Any = _Unset()
+
 
+def _unset() -> Any:
+    # A factory keeps the sentinel out of the OpenAPI defaults
+    return field(default_factory=lambda: _UNSET)
 
-class WarehouseBase(BaseModel):
-    code: str = Field(..., min_length=1, max_length=20)
-    name: str = Field(..., min_length=2, max_length=100)
+
+@dataclass(**SLOTS)
+class WarehouseBase:
+    code: WarehouseCode
+    name: WarehouseName
+    type: WarehouseType
     address: Optional[str] = None
     phone: Optional[str] = None
-    type: str = Field(..., pattern="^(warehouse|store)$")
     is_active: bool = True
     manager: Optional[str] = None
-    max_capacity: Optional[int] = Field(None, gt=0)
+    max_capacity: Optional[Capacity] = None
 
 
+@dataclass(**SLOTS)
 class WarehouseCreate(WarehouseBase):
     pass
 
 
-class WarehouseUpdate(BaseModel):
-    code: Optional[str] = Field(None, min_length=1, max_length=20)
-    name: Optional[str] = Field(None, min_length=2, max_length=100)
-    address: Optional[str] = None
-    phone: Optional[str] = None
-    type: Optional[str] = Field(None, pattern="^(warehouse|store)$")
-    is_active: Optional[bool] = None
-    manager: Optional[str] = None
-    max_capacity: Optional[int] = Field(None, gt=0)
+# Fields not sent keep _UNSET; an explicit null clears the optional
+# fields and is rejected for the required ones
+@dataclass(**SLOTS)
+class WarehouseUpdate:
+    code: WarehouseCode = _unset()
+    name: WarehouseName = _unset()
+    address: Optional[str] = _unset()
+    phone: Optional[str] = _unset()
+    type: WarehouseType = _unset()
+    is_active: bool = _unset()
+    manager: Optional[str] = _unset()
+    max_capacity: Optional[Capacity] = _unset()
 
+    def sent_fields(self) -> Dict[str, Any]:
+        """Return only the fields present in the request"""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not _UNSET
+        }
 
-class WarehouseResponse(WarehouseBase):
-    model_config = ConfigDict(from_attributes=True)
 
+@dataclass(**SLOTS)
+class WarehouseResponse:
     id: str
+    code: str
+    name: str
+    type: str
     created_at: datetime
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    is_active: bool = True
+    manager: Optional[str] = None
+    max_capacity: Optional[int] = None
 
 
-class WarehouseListResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+@dataclass(**SLOTS)
+class WarehouseListResponse:
     id: str
     code: str
     name: str
     type: str
-    is_active: bool
\ No newline at end of file
+    is_active: bool
@@ -1,8 +1,12 @@
+import asyncio
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, status, Query, Depends
 from beanie import PydanticObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from src.models.warehouse import Warehouse
+from src.models.warehouse import Warehouse, WarehouseListProjection
 from src.models.user import User
 from src.schemas.warehouse import (
     WarehouseCreate,
@@ -41,12 +45,36 @@ async def list_warehouses(
     if active is not None:
         query_params["is_active"] = active
 
-    # Get total
-    total_warehouses = await Warehouse.find(query_params).count()
+    # Resume after the cursor when given, otherwise skip to the page
+    page_params = dict(query_params)
+    skip = 0
+    if pagination.cursor:
+        try:
+            page_params["_id"] = {"$gt": PydanticObjectId(pagination.cursor)}
+        except InvalidId:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    else:
+        skip = (pagination.page - 1) * pagination.size
+
+    # Get total and paginated warehouses concurrently; one extra document
+    # tells whether there is a next page
+    page_query = (
+        Warehouse.find(page_params)
+        .project(WarehouseListProjection)
+        .sort("_id")
+        .skip(skip)
+        .limit(pagination.size + 1)
+    )
+    total_warehouses, warehouse_list = await asyncio.gather(
+        Warehouse.find(query_params).count(),
+        page_query.to_list()
+    )
 
-    # Get paginated warehouses
-    skip = (pagination.page - 1) * pagination.size
-    warehouse_list = await Warehouse.find(query_params).skip(skip).limit(pagination.size).to_list()
+    has_next = len(warehouse_list) > pagination.size
+    warehouse_list = warehouse_list[:pagination.size]
 
     # Convert to response
     warehouse_responses = [
@@ -60,16 +88,13 @@ async def list_warehouses(
         for warehouse in warehouse_list
     ]
 
-    total_pages = (total_warehouses + pagination.size - 1) // pagination.size
-
-    return PaginatedResponse(
-        items=warehouse_responses,
-        total=total_warehouses,
-        page=pagination.page,
-        pages=total_pages,
-        size=pagination.size,
-        has_next=pagination.page < total_pages,
-        has_prev=pagination.page > 1
+    return PaginatedResponse.build(
+        warehouse_responses,
+        total_warehouses,
+        pagination.page,
+        pagination.size,
+        next_cursor=str(warehouse_list[-1].id) if has_next else None,
+        cursor=pagination.cursor
     )
 
 
@@ -80,14 +105,6 @@ async def create_warehouse(
 ):
     """Create new warehouse"""
 
-    # Verify that code does not exist
-    existing_warehouse = await Warehouse.find_one({"code": warehouse_data.code})
-    if existing_warehouse:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Warehouse code already exists"
-        )
-
     # Create warehouse
     warehouse = Warehouse(
         code=warehouse_data.code.upper(),
@@ -100,7 +117,14 @@ async def create_warehouse(
         max_capacity=warehouse_data.max_capacity
     )
 
-    await warehouse.insert()
+    # The unique index on code rejects duplicates without a lookup first
+    try:
+        await warehouse.insert()
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Warehouse code already exists"
+        )
 
     return WarehouseResponse(
         id=str(warehouse.id),
@@ -125,7 +149,7 @@ async def get_warehouse(
 
     try:
         warehouse = await Warehouse.get(PydanticObjectId(warehouse_id))
-    except:
+    except InvalidId:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Warehouse not found"
@@ -161,7 +185,7 @@ async def update_warehouse(
 
     try:
         warehouse = await Warehouse.get(PydanticObjectId(warehouse_id))
-    except:
+    except InvalidId:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Warehouse not found"
@@ -173,24 +197,24 @@ async def update_warehouse(
             detail="Warehouse not found"
         )
 
+    # Update only the fields sent; an explicit null clears the value
+    update_data = warehouse_data.sent_fields()
+
+    # Codes are stored uppercased, so compare in uppercase
+    if "code" in update_data:
+        update_data["code"] = update_data["code"].upper()
+
     # Verify that code does not exist in another warehouse
-    if warehouse_data.code and warehouse_data.code != warehouse.code:
-        existing_warehouse = await Warehouse.find_one({"code": warehouse_data.code})
+    if "code" in update_data and update_data["code"] != warehouse.code.upper():
+        existing_warehouse = await Warehouse.find_one({"code": update_data["code"]})
         if existing_warehouse:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Warehouse code already exists"
             )
 
-    # Update fields
-    update_data = warehouse_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if field == "code" and value:
-            setattr(warehouse, field, value.upper())
-        else:
-            setattr(warehouse, field, value)
-
-    await warehouse.save()
+    if update_data:
+        await warehouse.set(update_data)
 
     return WarehouseResponse(
         id=str(warehouse.id),
@@ -214,23 +238,23 @@ async def delete_warehouse(
     """Delete warehouse (deactivate)"""
 
     try:
-        warehouse = await Warehouse.get(PydanticObjectId(warehouse_id))
-    except:
+        # Deactivate warehouse instead of deleting, in a single update
+        result = await Warehouse.get_motor_collection().update_one(
+            {"_id": PydanticObjectId(warehouse_id)},
+            {"$set": {"is_active": False}}
+        )
+    except InvalidId:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Warehouse not found"
         )
 
-    if not warehouse:
+    if not result.matched_count:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Warehouse not found"
         )
 
-    # Deactivate warehouse instead of deleting
-    warehouse.is_active = False
-    await warehouse.save()
-
     return {"message": "Warehouse deleted successfully"}
 
 
@@ -242,8 +266,14 @@ async def toggle_warehouse_status(
     """Activate/deactivate warehouse"""
 
     try:
-        warehouse = await Warehouse.get(PydanticObjectId(warehouse_id))
-    except:
+        # Flip the flag server-side in a single atomic operation
+        warehouse = await Warehouse.get_motor_collection().find_one_and_update(
+            {"_id": PydanticObjectId(warehouse_id)},
+            [{"$set": {"is_active": {"$not": "$is_active"}}}],
+            projection={"is_active": 1},
+            return_document=ReturnDocument.AFTER
+        )
+    except InvalidId:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Warehouse not found"
@@ -255,9 +285,5 @@ async def toggle_warehouse_status(
             detail="Warehouse not found"
         )
 
-    # Change status
-    warehouse.is_active = not warehouse.is_active
-    await warehouse.save()
-
-    status_str = "activated" if warehouse.is_active else "deactivated"
+    status_str = "activated" if warehouse["is_active"] else "deactivated"
     return {"message": f"Warehouse {status_str} successfully"}
\ No newline at end of file
@@ -3,30 +3,27 @@
 Script de prueba simple para verificar la funcionalidad básica del MVP
 """
 
-from app.core.security import verify_password, get_password_hash
+from src.auth.security import verify_password, get_password_hash
+from src.schemas.user import UserLogin
+
+_PASSWORD = "test123"
+_HASHED = get_password_hash(_PASSWORD)
 
 def test_password_functions():
     """Test password functions"""
-    password = "test123"
-    hashed = get_password_hash(password)
-    print(f"Original: {password}")
-    print(f"Hashed: {hashed}")
-    print(f"Verified: {verify_password(password, hashed)}")
-    print(f"Wrong password verified: {verify_password('wrong', hashed)}")
+    assert verify_password(_PASSWORD, _HASHED)
+    assert not verify_password("wrong", _HASHED)
 
 def test_user_schema():
     """Test user schema"""
-    try:
-        from app.schemas.user import UserLogin
-        login = UserLogin(username="test", password="pass")
-        print(f"UserLogin created: {login}")
-    except Exception as e:
-        print(f"Error creating UserLogin: {e}")
+    login = UserLogin(username="test", password="pass")
+    assert login.username == "test"
+    assert login.password == "pass"
 
 def test_config():
     """Test config"""
     try:
-        from app.config import settings
+        from src.config.settings import settings
         print(f"MongoDB URL: {settings.MONGODB_URL}")
         print(f"Environment: {settings.ENVIRONMENT}")
     except Exception as e:
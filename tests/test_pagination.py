@@ -0,0 +1,79 @@
+"""
+Pruebas de la paginación
+"""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from src.schemas.common import PaginatedResponse, PaginationParams
+
+
+def test_build_first_page():
+    """Test the first of several pages"""
+    page = PaginatedResponse.build(["a", "b"], total=5, page=1, size=2)
+    assert page.pages == 3
+    assert page.has_next
+    assert not page.has_prev
+    assert page.next_cursor is None
+
+
+def test_build_middle_page():
+    """Test a page between the first and the last"""
+    page = PaginatedResponse.build(["c", "d"], total=5, page=2, size=2)
+    assert page.pages == 3
+    assert page.has_next
+    assert page.has_prev
+
+
+def test_build_last_page():
+    """Test the last, partial page"""
+    page = PaginatedResponse.build(["e"], total=5, page=3, size=2)
+    assert page.pages == 3
+    assert not page.has_next
+    assert page.has_prev
+
+
+def test_build_exact_multiple():
+    """Test pages when total is a multiple of size"""
+    page = PaginatedResponse.build(["c", "d"], total=4, page=2, size=2)
+    assert page.pages == 2
+    assert not page.has_next
+
+
+def test_build_empty():
+    """Test an empty collection"""
+    page = PaginatedResponse.build([], total=0, page=1, size=20)
+    assert page.pages == 0
+    assert not page.has_next
+    assert not page.has_prev
+
+
+def test_build_cursor_with_next():
+    """Test cursor mode when more documents follow"""
+    page = PaginatedResponse.build(
+        ["c", "d"], total=5, page=1, size=2, next_cursor="d", cursor="b"
+    )
+    assert page.has_next
+    assert page.has_prev
+    assert page.next_cursor == "d"
+
+
+def test_build_cursor_last_page():
+    """Test cursor mode on the last page, whatever page says"""
+    page = PaginatedResponse.build(["e"], total=5, page=1, size=2, cursor="d")
+    assert not page.has_next
+    assert page.has_prev
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize("params", [{"size": 0}, {"size": -1}, {"page": 0}])
+def test_pagination_params_reject_values_below_one(params):
+    """Test page and size must be at least 1"""
+    with pytest.raises(ValidationError):
+        TypeAdapter(PaginationParams).validate_python(params)
+
+
+def test_pagination_params_defaults():
+    """Test default pagination"""
+    params = TypeAdapter(PaginationParams).validate_python({})
+    assert (params.page, params.size, params.cursor) == (1, 20, None)
@@ -0,0 +1,46 @@
+"""
+Pruebas de los permisos por rol
+"""
+
+from src.auth.permissions import (
+    PERMISSIONS_BY_ROLE,
+    SystemRole,
+    get_user_permissions,
+    has_permission,
+)
+
+
+def test_permission_keys_use_plain_values():
+    """Test permission keys are "module.action" strings"""
+    assert "users.create" in PERMISSIONS_BY_ROLE[SystemRole.ADMIN]
+
+
+def test_has_permission():
+    """Test role permission checks"""
+    assert has_permission(["admin"], "users.create")
+    assert not has_permission(["cashier"], "users.create")
+    assert has_permission(["cashier"], "sales.create")
+    assert not has_permission([], "sales.read")
+    assert not has_permission(["unknown"], "sales.read")
+
+
+def test_super_admin_has_every_permission():
+    """Test the wildcard role"""
+    assert has_permission(["super_admin"], "anything")
+    assert has_permission(["cashier", "super_admin"], "users.delete")
+
+
+def test_get_user_permissions_is_union_of_roles():
+    """Test user permissions combine all their roles"""
+    expected = (
+        set(PERMISSIONS_BY_ROLE[SystemRole.CASHIER])
+        | set(PERMISSIONS_BY_ROLE[SystemRole.WAREHOUSE_KEEPER])
+    )
+    permissions = get_user_permissions(["cashier", "warehouse_keeper"])
+
+    assert isinstance(permissions, list)
+    assert len(permissions) == len(expected)
+    assert set(permissions) == expected
+    # Cached results are not shared mutable state
+    permissions.append("users.delete")
+    assert "users.delete" not in get_user_permissions(["cashier", "warehouse_keeper"])